@@ -5,116 +5,327 @@ formatter.py
 JSON & Markdown Validator / Formatter
 
 CLI:
-    --validate-json file.json
-    --format-json file.json
-    --validate-md file.md
-    --format-md file.md
+    validate-json file.json [more.json 'glob/*.json' ...]
+    format-json file.json
+    validate-md file.md
+    format-md file.md
 
 Optional:
-    --out OUTPUT_FILE   (for format operations, to save output)
+    --out OUTPUT_FILE   (for format commands, to save output; written atomically)
+
+The older flag forms (--validate-json, --format-json, ...) are still accepted.
 """
 
 import argparse
+import contextlib
+import functools
+import glob
+import io
 import json
+import os
 import re
+import shutil
 import sys
-from typing import Tuple, List
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Optional, Tuple, List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_RE_LINE_COMMENT = re.compile(r'//.*')
+_RE_BLOCK_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+_RE_TRAILING_COMMA = re.compile(r',\s*([}\]])')
+_RE_SINGLE_QUOTED = re.compile(r"'([^'\\]*(?:\\.[^'\\]*)*)'")
+_RE_HEADING = re.compile(r'^(#{1,6})\s*(.*)$')
+_RE_HEADING_NOSPACE = re.compile(r'^(#{1,6})([^\s#].*)$')
+_RE_HEADING_PREFIX = re.compile(r'^#{1,6}\s')
+_RE_ALIGN_FULL = re.compile(r'^:?-{3,}:?$')
+# UTF-8 forms of the line breaks str.splitlines() knows beyond \n and \r.
+_EXTRA_BREAKS = (b'\x0b', b'\x0c', b'\x1c', b'\x1d', b'\x1e', b'\xc2\x85', b'\xe2\x80\xa8', b'\xe2\x80\xa9')
+
+_MAX_TARGETED_REPAIRS = 8
+_READ_BUFFER = 1 << 20
+_WRITE_BUFFER = 1 << 16
+
+def _read_chunks(f, size: int = _READ_BUFFER) -> Iterator[bytes]:
+    while True:
+        chunk = f.read(size)
+        if not chunk:
+            return
+        yield chunk
 
-def detect_json_errors(text: str) -> Tuple[bool, str]:
+@contextlib.contextmanager
+def _atomic_open(path: str, buffering: int = -1):
+    # Regular files are written next to the real target (following symlinks)
+    # under a unique name, then renamed over it, keeping the target's mode.
+    if os.path.exists(path) and not os.path.isfile(path):
+        # FIFOs, devices and /dev/stdout can't be renamed over; write in place.
+        with open(path, 'w', encoding='utf-8', buffering=buffering) as f:
+            yield f
+        return
+    target = os.path.realpath(path)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(target), prefix='.' + os.path.basename(target) + '.', suffix='.tmp')
     try:
-        json.loads(text)
-        return True, 'Valid JSON'
-    except json.JSONDecodeError as e:
-        return False, f"JSONDecodeError: {e.msg} (line {e.lineno} column {e.colno})"
+        with os.fdopen(fd, 'w', encoding='utf-8', buffering=buffering) as f:
+            yield f
+        if os.path.exists(target):
+            shutil.copymode(target, tmp)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp, 0o666 & ~umask)
+        os.replace(tmp, target)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+@contextlib.contextmanager
+def _stdout_writer():
+    # Batch large outputs into a block-buffered writer over the binary
+    # stream instead of going through print() line by line.
+    buf = getattr(sys.stdout, 'buffer', None)
+    if buf is None:
+        yield sys.stdout
+        return
+    sys.stdout.flush()
+    w = io.TextIOWrapper(buf, encoding=sys.stdout.encoding, errors=sys.stdout.errors)
+    try:
+        yield w
+    finally:
+        w.flush()
+        w.detach()
 
-def try_repair_json(text: str) -> str:
+def _json_loads(text: str):
+    # orjson is only the fast path: anything it rejects is re-parsed by the
+    # stdlib so error messages (and edge cases like big ints) stay the same.
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+def _has_float(obj) -> bool:
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if isinstance(o, float):
+            return True
+        if isinstance(o, dict):
+            stack.extend(o.values())
+        elif isinstance(o, list):
+            stack.extend(o)
+    return False
+
+def _json_dumps(obj) -> str:
+    # orjson spells floats differently (1e-7 vs 1e-07), so documents with
+    # floats go through the stdlib to keep output independent of orjson.
+    if orjson is not None and not _has_float(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+def _describe_json_error(e: json.JSONDecodeError) -> str:
+    return f"{e.msg} (line {e.lineno} column {e.colno})"
+
+def _drop_trailing_comma(text: str, pos: int) -> Optional[str]:
+    if pos >= len(text) or text[pos] not in '}]':
+        return None
+    j = pos - 1
+    while j >= 0 and text[j].isspace():
+        j -= 1
+    if j < 0 or text[j] != ',':
+        return None
+    return text[:j] + text[j+1:]
+
+def _replace_single_quotes(match) -> str:
+    inner = match.group(1)
+    if '"' in inner:
+        inner = inner.replace('"', '\\"')
+    return '"' + inner + '"'
+
+def try_repair_json(text: str, err: Optional[json.JSONDecodeError] = None) -> str:
     original = text
-    text = re.sub(r'//.*', '', text)
-    text = re.sub(r'/\*.*?\*/', '', text, flags=re.DOTALL)
-    text = re.sub(r',\s*(\}|])', r'\1', text)
-    def _replace_single_quotes(match):
-        inner = match.group(1)
-        inner_escaped = inner.replace('"', '\\"')
-        return '"' + inner_escaped + '"'
-    text = re.sub(r"'([^'\\]*(?:\\.[^'\\]*)*)'", _replace_single_quotes, text)
-    text = re.sub(r',\s*([}\]])', r'\1', text)
+    pos = None if err is None else err.pos
+    # With the parser's error at hand, first try fixing just that spot; a
+    # lone trailing comma then costs a re-parse instead of the full sweep.
+    for _ in range(_MAX_TARGETED_REPAIRS):
+        if pos is None:
+            break
+        fixed = _drop_trailing_comma(text, pos)
+        if fixed is None:
+            break
+        try:
+            _json_loads(fixed)
+            return fixed
+        except json.JSONDecodeError as e:
+            text, pos = fixed, e.pos
+    if '//' in text:
+        text = _RE_LINE_COMMENT.sub('', text)
+    if '/*' in text:
+        text = _RE_BLOCK_COMMENT.sub('', text)
+    text, removed = _RE_TRAILING_COMMA.subn(r'\1', text)
+    if "'" in text:
+        text = _RE_SINGLE_QUOTED.sub(_replace_single_quotes, text)
+    if removed:
+        # Removing one trailing comma can expose another (e.g. ",,]").
+        text = _RE_TRAILING_COMMA.sub(r'\1', text)
     return text if text.strip() else original
 
 def validate_json_file(path: str) -> int:
     with open(path, 'r', encoding='utf-8') as f:
         text = f.read()
-    ok, msg = detect_json_errors(text)
-    if ok:
-        print(f"[OK] {path}: {msg}")
-        return 0
-    else:
-        print(f"[ERR] {path}: {msg}")
-        repaired = try_repair_json(text)
+    try:
+        _json_loads(text)
+    except json.JSONDecodeError as e:
+        print(f"[ERR] {path}: JSONDecodeError: {_describe_json_error(e)}")
+        repaired = try_repair_json(text, e)
         if repaired != text:
             print('\n[HINT] Suggested repaired JSON (preview):\n')
             try:
-                parsed = json.loads(repaired)
-                preview = json.dumps(parsed, indent=2, ensure_ascii=False)
+                parsed = _json_loads(repaired)
+                preview = _json_dumps(parsed)
                 print(preview)
             except Exception:
                 print('  (auto-repair failed to produce valid JSON)')
         return 1
+    print(f"[OK] {path}: Valid JSON")
+    return 0
+
+def _validate_json_checked(path: str) -> int:
+    try:
+        return validate_json_file(path)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"[ERR] {path}: {e}")
+        return 1
+
+def _validate_json_captured(path: str) -> Tuple[int, str]:
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        rc = _validate_json_checked(path)
+    return rc, buf.getvalue()
+
+def _expand_paths(patterns: List[str]) -> List[str]:
+    paths = []
+    for pattern in patterns:
+        if os.path.exists(pattern) or not any(c in pattern for c in '*?['):
+            paths.append(pattern)
+            continue
+        matches = sorted(glob.glob(pattern))
+        paths.extend(matches or [pattern])
+    return paths
+
+def validate_json_files(patterns: List[str]) -> int:
+    paths = _expand_paths(patterns)
+    if len(paths) == 1:
+        return _validate_json_checked(paths[0])
+    with ProcessPoolExecutor() as ex:
+        results = list(ex.map(_validate_json_captured, paths, chunksize=8))
+    for _, output in results:
+        sys.stdout.write(output)
+    return max(rc for rc, _ in results)
 
 def format_json_file(path: str, out: str = None) -> int:
     with open(path, 'r', encoding='utf-8') as f:
         text = f.read()
     try:
-        obj = json.loads(text)
+        obj = _json_loads(text)
     except json.JSONDecodeError as e:
-        print(f"[ERR] Cannot format: JSON invalid - {e.msg} (line {e.lineno} column {e.colno})")
-        repaired = try_repair_json(text)
+        print(f"[ERR] Cannot format: JSON invalid - {_describe_json_error(e)}")
+        repaired = try_repair_json(text, e)
         try:
-            obj = json.loads(repaired)
+            obj = _json_loads(repaired)
             print("[INFO] Auto-repair succeeded; formatting repaired JSON.")
         except Exception:
             print("[ERR] Auto-repair failed; aborting format.")
             return 1
-    pretty = json.dumps(obj, indent=2, ensure_ascii=False)
+    pretty = _json_dumps(obj)
     if out:
-        with open(out, 'w', encoding='utf-8') as f:
-            f.write(pretty + "\n")
+        with _atomic_open(out) as f:
+            f.write(pretty)
+            f.write('\n')
         print(f"[OK] Formatted JSON saved to {out}")
     else:
-        print(pretty)
+        with _stdout_writer() as w:
+            w.write(pretty)
+            w.write('\n')
     return 0
 
 # -------------------------
 # Markdown processing
 # -------------------------
 def normalize_heading(line: str) -> str:
-    m = re.match(r'^(#{1,6})\s*(.*)$', line)
+    m = _RE_HEADING.match(line)
     if m:
         hashes = m.group(1)
         text = m.group(2).strip()
         return f"{hashes} {text}"
-    m2 = re.match(r'^(#{1,6})([^\s#].*)$', line)
+    m2 = _RE_HEADING_NOSPACE.match(line)
     if m2:
         hashes = m2.group(1)
         text = m2.group(2).strip()
         return f"{hashes} {text}"
     return line
 
-def find_tables(lines: List[str]) -> List[tuple]:
-    ranges = []
+def iter_md_blocks(lines: Iterable[str]) -> Iterator[Tuple[int, List[str], bool]]:
+    it = iter(lines)
+    line = next(it, None)
     i = 0
-    n = len(lines)
-    while i < n - 1:
-        if '|' in lines[i]:
-            j = i + 1
-            if '|' in lines[j] and re.search(r':?-{3,}:?', lines[j]):
-                k = j + 1
-                while k < n and ('|' in lines[k] and lines[k].strip() != ''):
-                    k += 1
-                ranges.append((i, k))
-                i = k
-                continue
-        i += 1
-    return ranges
+    while line is not None:
+        nxt = next(it, None)
+        if nxt is not None and '|' in line and '|' in nxt and '---' in nxt:
+            block = [line, nxt]
+            nxt = next(it, None)
+            while nxt is not None and '|' in nxt:
+                block.append(nxt)
+                nxt = next(it, None)
+            yield i, block, True
+            i += len(block)
+        else:
+            yield i, [line], False
+            i += 1
+        line = nxt
+
+def _iter_table_spans(raw: str) -> Iterator[Tuple[int, List[str]]]:
+    # Same detection as iter_md_blocks, but driven by str.find over the whole
+    # text: lines without a '|' are never split out into separate strings.
+    n = len(raw)
+    lineno = 0
+    counted = 0
+    pos = raw.find('|')
+    while pos != -1:
+        start = raw.rfind('\n', 0, pos) + 1
+        end = raw.find('\n', pos)
+        if end == -1 or end + 1 >= n:
+            return
+        nstart = end + 1
+        nend = raw.find('\n', nstart)
+        if nend == -1:
+            nend = n
+        if raw.find('|', nstart, nend) == -1 or raw.find('---', nstart, nend) == -1:
+            pos = raw.find('|', end)
+            continue
+        while nend < n - 1:
+            nxt_end = raw.find('\n', nend + 1)
+            if nxt_end == -1:
+                nxt_end = n
+            if raw.find('|', nend + 1, nxt_end) == -1:
+                break
+            nend = nxt_end
+        lineno += raw.count('\n', counted, start)
+        counted = start
+        yield lineno, raw[start:nend].split('\n')
+        pos = raw.find('|', nend)
+
+def find_tables(lines: List[str]) -> List[tuple]:
+    raw = ''.join(l if l.endswith('\n') else l + '\n' for l in lines)
+    return [(start, start + len(block)) for start, block in _iter_table_spans(raw)]
 
 def parse_table_block(block: List[str]):
     if len(block) < 2:
@@ -141,114 +352,197 @@ def validate_table(rows: List[List[str]], sep_line: str):
     if len(parts) != ncols:
         return False, f'Separator has {len(parts)} columns; expected {ncols}'
     for p in parts:
-        if not re.match(r'^:?-{3,}:?$', p):
+        if not _RE_ALIGN_FULL.match(p):
             return False, f"Separator segment '{p}' is not a valid alignment marker (--- or :---:)"
     return True, 'Table looks valid'
 
-def format_table(rows: List[List[str]]) -> str:
+@functools.lru_cache(maxsize=256)
+def _row_formatter(widths: Tuple[int, ...]) -> Tuple[str, str]:
+    row_fmt = '| ' + ' | '.join('{:<%d}' % w for w in widths) + ' |'
+    sep = '| ' + ' | '.join('-' * max(3, w) for w in widths) + ' |'
+    return row_fmt, sep
+
+def format_table_lines(rows: List[List[str]]) -> List[str]:
     if not rows:
-        return ''
-    ncols = len(rows[0])
-    widths = [0]*ncols
-    for r in rows:
-        for i, c in enumerate(r):
-            widths[i] = max(widths[i], len(c))
-    header = '| ' + ' | '.join(r.ljust(widths[i]) for i, r in enumerate(rows[0])) + ' |'
-    sep = '| ' + ' | '.join('-' * max(3, widths[i]) for i in range(ncols)) + ' |'
-    body_lines = []
-    for r in rows[1:]:
-        line = '| ' + ' | '.join(r.ljust(widths[i]) for i, r in enumerate(r)) + ' |'
-        body_lines.append(line)
-    return '\n'.join([header, sep] + body_lines)
+        return []
+    widths = tuple(max(map(len, col)) for col in zip(*rows))
+    row_fmt, sep = _row_formatter(widths)
+    lines = [row_fmt.format(*r) for r in rows]
+    lines.insert(1, sep)
+    return lines
+
+def format_table(rows: List[List[str]]) -> str:
+    return '\n'.join(format_table_lines(rows))
 
 def validate_md_file(path: str) -> int:
     with open(path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+        raw = f.read()
     problems = []
-    table_ranges = find_tables(lines)
-    for start, end in table_ranges:
-        block = [l.rstrip('\n') for l in lines[start:end]]
+    for start, block in _iter_table_spans(raw):
         rows, sep = parse_table_block(block)
         ok, msg = validate_table(rows, sep)
         if not ok:
-            problems.append(f'Table at lines {start+1}-{end} : {msg}')
+            problems.append(f'Table at lines {start+1}-{start+len(block)} : {msg}')
     if problems:
         print('[ERR] Markdown validation found issues:')
-        for p in problems:
-            print('  -', p)
+        print('\n'.join('  - ' + p for p in problems))
         return 1
     print('[OK] No table structure issues found in', path)
     return 0
 
-def format_md_file(path: str, out: str = None) -> int:
-    with open(path, 'r', encoding='utf-8') as f:
-        raw = f.read()
-    lines = raw.splitlines()
-    new_lines = []
-    i = 0
-    n = len(lines)
-    while i < n:
-        line = lines[i]
-        line = normalize_heading(line)
-        if re.match(r'^#{1,6}\s', line):
-            new_lines.append(line.strip())
-            if i+1 < n and lines[i+1].strip() != "":
-                new_lines.append("")
-            i += 1
+def _split_md_lines(f: Iterable[str]) -> Iterator[str]:
+    # Match str.splitlines(), which also breaks on \f, \v, \x1c-\x1e, \x85
+    # and \u2028/\u2029; iterating a file only breaks on newlines.
+    for line in f:
+        yield from line.splitlines()
+
+def normalize_md_lines(lines: Iterable[str]) -> Iterator[str]:
+    it = iter(lines)
+    line = next(it, None)
+    while line is not None:
+        nxt = next(it, None)
+        # Headings always start with '#'; every other line only needs its
+        # trailing whitespace dropped, which rstrip() does in one C call.
+        if line[:1] != '#':
+            yield line.rstrip()
+            line = nxt
             continue
-        new_lines.append(line.rstrip())
-        i += 1
-    out_lines = []
-    i = 0
-    n = len(new_lines)
-    while i < n:
-        line = new_lines[i]
-        if '|' in line and i+1 < n and '|' in new_lines[i+1] and re.search(r':?-{3,}:?', new_lines[i+1]):
-            block = []
-            j = i
-            while j < n and '|' in new_lines[j] and new_lines[j].strip() != "":
-                block.append(new_lines[j])
-                j += 1
+        line = normalize_heading(line)
+        if _RE_HEADING_PREFIX.match(line):
+            yield line.strip()
+            if nxt is not None and nxt.strip() != "":
+                yield ""
+        else:
+            yield line.rstrip()
+        line = nxt
+
+def _format_md_tables(lines: Iterable[str]) -> Iterator[str]:
+    for _, block, is_table in iter_md_blocks(lines):
+        if is_table:
             rows, sep = parse_table_block(block)
             ok, msg = validate_table(rows, sep)
-            if not ok:
-                out_lines.extend(block)
-            else:
-                formatted = format_table(rows)
-                out_lines.extend(formatted.splitlines())
-            i = j
+            if ok:
+                yield format_table(rows)
+                continue
+        yield from block
+
+def _write_md_lines(lines: Iterable[str], w) -> None:
+    # Blank lines are held back until more content follows, so trailing
+    # blank lines are dropped without buffering the whole document.
+    pending = []
+    wrote = False
+    for line in lines:
+        if not line.strip():
+            pending.append(line)
             continue
-        out_lines.append(line)
-        i += 1
-    final_text = '\n'.join(out_lines).rstrip() + '\n'
+        for p in pending:
+            w.write(p)
+            w.write('\n')
+        pending.clear()
+        w.write(line)
+        w.write('\n')
+        wrote = True
+    if not wrote:
+        w.write('\n')
+
+def _scan_md_bytes(fb) -> Tuple[bool, bool]:
+    # '|' never occurs inside a multi-byte UTF-8 sequence, so a raw byte scan
+    # tells up front whether the table pass and the extra line splitting are
+    # needed. Two bytes are carried over so breaks split across chunks count.
+    has_pipe = has_breaks = False
+    tail = b''
+    for chunk in _read_chunks(fb):
+        has_pipe = has_pipe or b'|' in chunk
+        if not has_breaks:
+            edge = tail + chunk[:2]
+            has_breaks = any(b in chunk or b in edge for b in _EXTRA_BREAKS)
+        if has_pipe and has_breaks:
+            break
+        tail = chunk[-2:]
+    return has_pipe, has_breaks
+
+def _format_md_into(path: str, w) -> None:
+    with open(path, 'rb', buffering=_READ_BUFFER) as fb:
+        # Pipes can only be read once, so they always get the full treatment.
+        has_tables = has_breaks = True
+        if fb.seekable():
+            has_tables, has_breaks = _scan_md_bytes(fb)
+            fb.seek(0)
+        lines = io.TextIOWrapper(fb, encoding='utf-8')
+        if has_breaks:
+            lines = _split_md_lines(lines)
+        lines = normalize_md_lines(lines)
+        if has_tables:
+            lines = _format_md_tables(lines)
+        _write_md_lines(lines, w)
+
+def format_md_file(path: str, out: str = None) -> int:
     if out:
-        with open(out, 'w', encoding='utf-8') as f:
-            f.write(final_text)
+        # The input is closed before _atomic_open renames over the target,
+        # which Windows requires when formatting a file in place.
+        with _atomic_open(out, buffering=_WRITE_BUFFER) as w:
+            _format_md_into(path, w)
         print(f"[OK] Formatted Markdown saved to {out}")
     else:
-        print(final_text)
+        with _stdout_writer() as w:
+            _format_md_into(path, w)
+            w.write('\n')
     return 0
 
+_LEGACY_FLAGS = ('--validate-json', '--format-json', '--validate-md', '--format-md')
+
+def _legacy_argv(argv: List[str]) -> List[str]:
+    # Map the old "--format-md file.md --out x" form onto the subcommands.
+    for i, arg in enumerate(argv):
+        flag, eq, value = arg.partition('=')
+        if flag not in _LEGACY_FLAGS:
+            continue
+        rest = argv[:i] + ([value] if eq else []) + argv[i+1:]
+        if flag.startswith('--validate'):
+            rest = _drop_out(rest)
+        return [flag[2:]] + rest
+    return argv
+
+def _drop_out(argv: List[str]) -> List[str]:
+    # The flag-based CLI accepted (and ignored) --out for validation.
+    kept = []
+    skip = False
+    for arg in argv:
+        if skip:
+            skip = False
+        elif arg == '--out':
+            skip = True
+        elif not arg.startswith('--out='):
+            kept.append(arg)
+    return kept
+
 def main():
     parser = argparse.ArgumentParser(description='JSON & Markdown Formatter / Validator')
-    parser.add_argument('--validate-json', help='Validate JSON file path')
-    parser.add_argument('--format-json', help='Format JSON file path')
-    parser.add_argument('--validate-md', help='Validate Markdown file path')
-    parser.add_argument('--format-md', help='Format Markdown file path')
-    parser.add_argument('--out', help='Optional output path for format commands')
-    args = parser.parse_args()
-
-    if args.validate_json:
-        sys.exit(validate_json_file(args.validate_json))
-    if args.format_json:
-        sys.exit(format_json_file(args.format_json, args.out))
-    if args.validate_md:
-        sys.exit(validate_md_file(args.validate_md))
-    if args.format_md:
-        sys.exit(format_md_file(args.format_md, args.out))
-
-    parser.print_help()
-    sys.exit(0)
+    sub = parser.add_subparsers(dest='cmd', metavar='COMMAND')
+
+    p = sub.add_parser('validate-json', help='Validate JSON file paths or glob patterns (checked in parallel)')
+    p.add_argument('paths', nargs='+', metavar='PATH')
+    p.set_defaults(run=lambda a: validate_json_files(a.paths))
+
+    p = sub.add_parser('format-json', help='Format JSON file path')
+    p.add_argument('path')
+    p.add_argument('--out', help='Optional output path')
+    p.set_defaults(run=lambda a: format_json_file(a.path, a.out))
+
+    p = sub.add_parser('validate-md', help='Validate Markdown file path')
+    p.add_argument('path')
+    p.set_defaults(run=lambda a: validate_md_file(a.path))
+
+    p = sub.add_parser('format-md', help='Format Markdown file path')
+    p.add_argument('path')
+    p.add_argument('--out', help='Optional output path')
+    p.set_defaults(run=lambda a: format_md_file(a.path, a.out))
+
+    args = parser.parse_args(_legacy_argv(sys.argv[1:]))
+    if args.cmd is None:
+        parser.print_help()
+        sys.exit(0)
+    sys.exit(args.run(args))
 
 if __name__ == '__main__':
     main()